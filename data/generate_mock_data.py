@@ -1,6 +1,39 @@
 import os
+import math
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
 import pandas as pd
 
+KPI_COLUMNS = ["CSAT", "OnTimeDelivery", "BudgetVariance"]
+
+# Marginal distribution per KPI column. Supported kinds: "normal", "student_t"
+# (heavy tails, useful for budget-variance outliers, requires df > 2) and
+# "lognormal" (mean/std of the underlying normal, correlation applies to it too).
+DEFAULT_DISTRIBUTIONS = {
+    "CSAT": {"kind": "normal", "mean": 85.0, "std": 6.0, "min": 0.0, "max": 100.0},
+    "OnTimeDelivery": {"kind": "normal", "mean": 90.0, "std": 5.0, "min": 0.0, "max": 100.0},
+    "BudgetVariance": {"kind": "student_t", "mean": 0.0, "std": 2.5, "df": 3},
+}
+
+# Correlation between the KPI columns, in KPI_COLUMNS order. Late projects tend
+# to have unhappy customers and to run over budget (negative variance).
+DEFAULT_CORRELATION = [
+    [1.0, 0.6, 0.3],
+    [0.6, 1.0, 0.4],
+    [0.3, 0.4, 1.0],
+]
+
+# Random draws are seeded per block of this many rows, so the output does not
+# depend on how many rows are written at a time.
+BLOCK_ROWS = 100_000
+
+DEFAULT_SEGMENTS = {
+    "Region": ["EMEA", "NAM", "LATAM", "APAC"],
+    "Team": ["Platform", "Mobile", "Web", "Data", "Infra"],
+}
+
+
 def generate_mock_data():
     """
     Generates a mock_data.csv file with sample data for the dashboard.
@@ -27,6 +60,242 @@ def generate_mock_data():
     mock_data_df.to_csv(file_path, index=False)
     print(f"Mock data saved to {file_path}")
 
+
+def _inverse_scale_moments(dist):
+    """
+    Return (E[1/s], E[1/s^2]) of the per-row scale s = sqrt(chi2(df) / df) used by
+    "student_t" columns; other kinds have s = 1.
+    """
+    if dist.get("kind", "normal") != "student_t":
+        return 1.0, 1.0
+    df = dist["df"]
+    first = math.sqrt(df / 2.0) * math.gamma((df - 1) / 2.0) / math.gamma(df / 2.0)
+    return first, df / (df - 2.0)
+
+
+def _latent_correlation(config):
+    """
+    Correlation matrix for the underlying normals, adjusted so that the generated
+    columns have the configured correlation.
+    Student-t columns with the same df share one chi-square scale per row (a true
+    multivariate t), which leaves their mutual correlation unchanged. Between a
+    student_t column and a column with another scale, dividing by the scale
+    attenuates the correlation by E[1/(s_i s_j)] / sqrt(E[1/s_i^2] E[1/s_j^2]),
+    so the latent correlation is divided by that factor.
+    """
+    target = np.asarray(config["correlation"], dtype=float)
+    dists = [config["distributions"][column] for column in KPI_COLUMNS]
+    latent = target.copy()
+    for i, dist_i in enumerate(dists):
+        for j, dist_j in enumerate(dists):
+            if i == j:
+                continue
+            first_i, second_i = _inverse_scale_moments(dist_i)
+            first_j, second_j = _inverse_scale_moments(dist_j)
+            shared = dist_i.get("kind") == dist_j.get("kind") == "student_t" and dist_i["df"] == dist_j["df"]
+            cross = second_i if shared else first_i * first_j
+            latent[i, j] = target[i, j] / (cross / math.sqrt(second_i * second_j))
+
+    try:
+        np.linalg.cholesky(latent)
+    except np.linalg.LinAlgError:
+        raise ValueError("The correlation matrix cannot be reached with these student_t marginals.")
+    return latent
+
+
+def generate_chunk(rng, start_row, num_rows, config):
+    """
+    Generates one chunk of synthetic project rows.
+    :param rng: A numpy Generator used for all random draws of this chunk.
+    :param start_row: Global index of the first row (keeps Project ids and dates ordered).
+    :param num_rows: Number of rows to generate.
+    :param config: Generation settings (see generate_sharded_data).
+    :return: A pandas DataFrame.
+    """
+    # Correlated standard normals via the Cholesky factor of the latent correlation matrix
+    cholesky = np.linalg.cholesky(_latent_correlation(config))
+    z = rng.standard_normal((num_rows, len(KPI_COLUMNS))) @ cholesky.T
+
+    # One chi-square scale per row and df, shared by all student_t columns with that df
+    scales = {}
+
+    row_ids = np.arange(start_row, start_row + num_rows)
+    chunk = {"Project": np.char.add("Project", (row_ids + 1).astype(str))}
+
+    # Time ordering: one row every `interval_seconds`, globally increasing
+    start = np.datetime64(config["start_date"], "s")
+    chunk["Date"] = start + row_ids * np.timedelta64(config["interval_seconds"], "s")
+
+    for name, values in config["segments"].items():
+        chunk[name] = np.asarray(values)[rng.integers(0, len(values), num_rows)]
+
+    for idx, column in enumerate(KPI_COLUMNS):
+        dist = config["distributions"][column]
+        kind = dist.get("kind", "normal")
+        if kind == "normal":
+            values = dist["mean"] + dist["std"] * z[:, idx]
+        elif kind == "student_t":
+            df = dist["df"]
+            if df not in scales:
+                scales[df] = np.sqrt(rng.chisquare(df, num_rows) / df)
+            # A t(df) variable has variance df / (df - 2); rescale so "std" is the real std
+            values = dist["mean"] + dist["std"] * math.sqrt((df - 2.0) / df) * z[:, idx] / scales[df]
+        elif kind == "lognormal":
+            values = np.exp(dist["mean"] + dist["std"] * z[:, idx])
+        else:
+            raise ValueError(f"Unsupported distribution kind for {column}: {kind}")
+
+        values = np.clip(values, dist.get("min", -np.inf), dist.get("max", np.inf))
+        values = np.round(values, config["decimals"])
+
+        missing_rate = config["missing_rate"]
+        if missing_rate > 0:
+            values[rng.random(num_rows) < missing_rate] = np.nan
+        chunk[column] = values
+
+    return pd.DataFrame(chunk)
+
+
+def _write_shard(shard_index, start_row, num_rows, output_dir, file_format, config):
+    """
+    Generates and writes one shard in streaming chunks; runs in a worker process.
+    :return: The path of the written shard.
+    """
+    file_path = os.path.join(output_dir, f"mock_data_{shard_index:05d}.{file_format}")
+    chunk_rows = config["chunk_rows"]
+
+    writer = None
+    buffered = []
+    buffered_rows = 0
+    first_write = True
+    try:
+        for block_start in range(0, num_rows, BLOCK_ROWS):
+            # Seeding by (seed, shard, block) makes every block reproducible on its own
+            rng = np.random.default_rng([config["seed"], shard_index, block_start // BLOCK_ROWS])
+            size = min(BLOCK_ROWS, num_rows - block_start)
+            buffered.append(generate_chunk(rng, start_row + block_start, size, config))
+            buffered_rows += size
+
+            if buffered_rows < chunk_rows and block_start + size < num_rows:
+                continue
+
+            chunk = pd.concat(buffered, ignore_index=True) if len(buffered) > 1 else buffered[0]
+            buffered, buffered_rows = [], 0
+
+            if file_format == "csv":
+                chunk.to_csv(file_path, mode="w" if first_write else "a", header=first_write, index=False)
+            else:
+                import pyarrow as pa
+                import pyarrow.parquet as pq
+
+                table = pa.Table.from_pandas(chunk, preserve_index=False)
+                if writer is None:
+                    writer = pq.ParquetWriter(file_path, table.schema)
+                writer.write_table(table)
+            first_write = False
+    finally:
+        if writer is not None:
+            writer.close()
+
+    return file_path
+
+
+def generate_sharded_data(num_rows, output_dir, rows_per_shard=10_000_000, chunk_rows=1_000_000,
+                          file_format="csv", workers=None, seed=0, distributions=None,
+                          correlation=None, segments=None, missing_rate=0.0,
+                          start_date="2020-01-01", interval_seconds=60, decimals=2):
+    """
+    Generates an arbitrarily large synthetic dataset as sharded CSV or Parquet files.
+    Shards are generated in parallel across processes and each shard is written in
+    chunks, so memory use is bounded by roughly chunk_rows + BLOCK_ROWS rows per worker.
+    :param num_rows: Total number of rows to generate.
+    :param output_dir: Directory that receives the shard files.
+    :param rows_per_shard: Maximum number of rows per shard file.
+    :param chunk_rows: Number of rows written at a time (does not affect the generated values).
+    :param file_format: "csv" or "parquet" (parquet requires pyarrow).
+    :param workers: Number of worker processes (defaults to the CPU count).
+    :param seed: Seed for reproducible output (same seed and rows_per_shard, same data,
+        whatever chunk_rows and workers are).
+    :param distributions: Per-column distribution settings, see DEFAULT_DISTRIBUTIONS.
+    :param correlation: KPI correlation matrix, see DEFAULT_CORRELATION.
+    :param segments: Segment columns and their values, see DEFAULT_SEGMENTS.
+    :param missing_rate: Fraction of KPI values replaced by missing values.
+    :param start_date: Timestamp of the first row.
+    :param interval_seconds: Time between consecutive rows.
+    :param decimals: Number of decimals kept for the KPI values.
+    :return: A list of the written shard paths.
+    """
+    if file_format not in ("csv", "parquet"):
+        raise ValueError(f"Unsupported file format: {file_format}")
+    for column, dist in (distributions or {}).items():
+        if column not in KPI_COLUMNS:
+            raise ValueError(f"Unknown KPI column in distributions: {column}")
+    if file_format == "parquet":
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            raise ImportError("Writing Parquet shards requires pyarrow (pip install pyarrow).")
+
+    config = {
+        "seed": seed,
+        "chunk_rows": chunk_rows,
+        # Overrides are merged per column and per key, so one column can be changed alone
+        "distributions": {
+            column: {**DEFAULT_DISTRIBUTIONS[column], **(distributions or {}).get(column, {})}
+            for column in KPI_COLUMNS
+        },
+        "correlation": DEFAULT_CORRELATION if correlation is None else correlation,
+        "segments": DEFAULT_SEGMENTS if segments is None else segments,
+        "missing_rate": missing_rate,
+        "start_date": start_date,
+        "interval_seconds": interval_seconds,
+        "decimals": decimals,
+    }
+
+    for column, dist in config["distributions"].items():
+        if dist.get("kind", "normal") == "student_t" and not dist.get("df", 0) > 2:
+            raise ValueError(f"student_t distribution for {column} needs df > 2, got {dist.get('df')}.")
+
+    os.makedirs(output_dir, exist_ok=True)
+    shards = [
+        (index, start, min(rows_per_shard, num_rows - start))
+        for index, start in enumerate(range(0, num_rows, rows_per_shard))
+    ]
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(_write_shard, index, start, size, output_dir, file_format, config)
+            for index, start, size in shards
+        ]
+        paths = [future.result() for future in futures]
+
+    print(f"Generated {num_rows} rows in {len(paths)} shard(s) under {output_dir}")
+    return paths
+
+
 # Generate the mock data when this script is run
 if __name__ == "__main__":
-    generate_mock_data()
+    parser = argparse.ArgumentParser(description="Generate mock KPI data for the dashboard.")
+    parser.add_argument("--rows", type=int, help="Total rows to generate (omit for the 5-row sample file).")
+    parser.add_argument("--output-dir", default=os.path.join(os.path.dirname(os.path.abspath(__file__)), "generated"))
+    parser.add_argument("--rows-per-shard", type=int, default=10_000_000)
+    parser.add_argument("--chunk-rows", type=int, default=1_000_000)
+    parser.add_argument("--format", choices=["csv", "parquet"], default="csv")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--missing-rate", type=float, default=0.0)
+    args = parser.parse_args()
+
+    if args.rows is None:
+        generate_mock_data()
+    else:
+        generate_sharded_data(
+            args.rows,
+            args.output_dir,
+            rows_per_shard=args.rows_per_shard,
+            chunk_rows=args.chunk_rows,
+            file_format=args.format,
+            workers=args.workers,
+            seed=args.seed,
+            missing_rate=args.missing_rate,
+        )
@@ -1,54 +1,269 @@
+import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import tkinter as tk
 from tkinter import messagebox
 from src.data_ingestion import DataIngestion
-from src.data_processing import DataProcessing
+from src.data_processing import DataProcessing, KPI_COLUMNS, PERCENTILES
 from src.insights import Insights
 from src.ISO_CMMI_Analyzer import ChecklistAnalysis
+from src.figure_pool import FigurePool
+from src.insights_view import InsightsView
+from src.checklist_collector import ChecklistCache, ChecklistCollector
+from concurrent.futures import ThreadPoolExecutor
+import contextlib
+import glob
+import io
 import os
+import sys
+import threading
+
+# Per-project ISO/CMMI checklist answers, kept between runs
+CHECKLIST_CACHE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "checklist_cache.json")
+CHECKLIST_HTTP_PORT = 8765
+
+# Figures, canvases and artists are reused across dashboard refreshes
+_figure_pool = FigurePool()
+
+
+def _set_project_axis(ax, projects):
+    """
+    Use numeric x positions labelled with the project names, so artists can be
+    updated in place when the set of projects changes.
+    """
+    ax.set_xticks(range(len(projects)))
+    ax.set_xticklabels(projects)
+
+
+def _update_line(pooled, name, projects, values, **plot_kwargs):
+    """
+    Create a line on first use, afterwards only replace its data.
+    :return: True if the line's data changed.
+    """
+    x = np.arange(len(projects))
+    y = np.asarray(values, dtype=float)
+    line = pooled.artists.get(name)
+    if line is None:
+        (line,) = pooled.ax.plot(x, y, **plot_kwargs)
+        pooled.artists[name] = line
+        return True
+    if np.array_equal(line.get_xdata(), x) and np.array_equal(line.get_ydata(), y):
+        return False
+    line.set_data(x, y)
+    return True
+
+
+def _update_bars(pooled, projects, values, colors=None):
+    """
+    Update bar heights (and colors) in place; bars are only rebuilt when the
+    number of projects changes.
+    :return: True if any bar changed.
+    """
+    values = np.asarray(values, dtype=float)
+    bars = pooled.artists.get("bars")
+    if bars is not None and len(bars) == len(values):
+        heights = np.array([rect.get_height() for rect in bars])
+        if np.array_equal(heights, values) and pooled.artists.get("bar colors") == colors:
+            return False
+        for idx, (rect, value) in enumerate(zip(bars, values)):
+            rect.set_height(value)
+            if colors is not None:
+                rect.set_color(colors[idx])
+    else:
+        if bars is not None:
+            bars.remove()
+        pooled.artists["bars"] = pooled.ax.bar(range(len(projects)), values, color=colors)
+    pooled.artists["bar colors"] = colors
+    return True
+
+
+def _labels_changed(pooled, projects):
+    """
+    Check whether the project tick labels differ from the ones last drawn.
+    """
+    if pooled.artists.get("projects") == projects:
+        return False
+    pooled.artists["projects"] = projects
+    return True
+
+
+def _rescale(pooled, projects):
+    """
+    Recompute the axes limits and tick labels after the data changed, then schedule a full redraw.
+    Hidden artists (e.g. a cleared highlight marker) do not count towards the limits.
+    """
+    _set_project_axis(pooled.ax, projects)
+    pooled.ax.relim(visible_only=True)
+    pooled.ax.autoscale_view()
+    pooled.redraw()
+
+
+def highlight_project(index):
+    """
+    Highlight a project on every pooled KPI chart. Only the highlight marker is
+    redrawn (blitted); the rest of each chart is restored from its cached background.
+    :param index: Position of the project in the dataset.
+    """
+    for key in ("csat", "on_time", "budget"):
+        pooled = _figure_pool.figures.get(key)
+        if pooled is None or not pooled.is_alive():
+            continue
+
+        marker = pooled.artists.get("highlight")
+        if marker is None:
+            marker = pooled.add_animated("highlight", pooled.ax.axvline(index, color="orange", linewidth=2, alpha=0.6))
+        marker.set_xdata([index, index])
+        marker.set_visible(True)
+        pooled.blit()
+
+
+def _clear_highlight(pooled):
+    """
+    Hide the highlight marker, e.g. before the chart's data (and project order) changes.
+    """
+    marker = pooled.artists.get("highlight")
+    if marker is not None:
+        marker.set_visible(False)
+
+
+def _on_chart_click(event):
+    """
+    Select the project closest to a mouse click on any KPI chart.
+    """
+    if event.inaxes is None or event.xdata is None:
+        return
+    # All KPI charts show the same projects; clicks beyond the first or last one select it
+    csat = _figure_pool.figures.get("csat")
+    projects = csat.artists.get("projects") if csat is not None else None
+    if not projects:
+        return
+    highlight_project(min(max(int(round(event.xdata)), 0), len(projects) - 1))
+
+
+def refresh_kpi_charts(data, parent_frame):
+    """
+    Draws or refreshes the three KPI charts inside the given frame. On repeated
+    calls with the same frame the figures, canvases and artists are reused and
+    only their data is replaced.
+    :param data: The project dataset.
+    :param parent_frame: The frame in which to embed the charts.
+    """
+    projects = data["Project"].tolist()
+
+    # Customer Satisfaction Line Chart
+    csat, created = _figure_pool.acquire("csat", parent_frame)
+    if created:
+        csat.ax.set_title("Customer Satisfaction Over Projects")
+        csat.ax.set_xlabel("Project")
+        csat.ax.set_ylabel("CSAT (%)")
+        csat.canvas.get_tk_widget().grid(row=0, column=0, padx=10, pady=10)
+        csat.canvas.mpl_connect("button_press_event", _on_chart_click)
+    changed = _update_line(csat, "line", projects, data["CSAT"], marker="o")
+    if _labels_changed(csat, projects) or changed:
+        _clear_highlight(csat)
+        _rescale(csat, projects)
+
+    # On-Time Delivery Bar Chart
+    on_time, created = _figure_pool.acquire("on_time", parent_frame)
+    if created:
+        on_time.ax.set_title("On-Time Delivery Rate by Project")
+        on_time.ax.set_xlabel("Project")
+        on_time.ax.set_ylabel("On-Time Delivery Rate (%)")
+        on_time.canvas.get_tk_widget().grid(row=0, column=1, padx=10, pady=10)
+        on_time.canvas.mpl_connect("button_press_event", _on_chart_click)
+    changed = _update_bars(on_time, projects, data["OnTimeDelivery"])
+    if _labels_changed(on_time, projects) or changed:
+        _clear_highlight(on_time)
+        _rescale(on_time, projects)
+
+    # Budget Variance Bar Chart
+    budget, created = _figure_pool.acquire("budget", parent_frame)
+    if created:
+        budget.ax.axhline(0, color="black", linewidth=0.8, linestyle="--")
+        budget.ax.set_title("Budget Variance by Project")
+        budget.ax.set_xlabel("Project")
+        budget.ax.set_ylabel("Budget Variance")
+        budget.canvas.get_tk_widget().grid(row=0, column=2, padx=10, pady=10)
+        budget.canvas.mpl_connect("button_press_event", _on_chart_click)
+    colors = ["green" if v >= 0 else "red" for v in data["BudgetVariance"]]
+    changed = _update_bars(budget, projects, data["BudgetVariance"], colors=colors)
+    if _labels_changed(budget, projects) or changed:
+        _clear_highlight(budget)
+        _rescale(budget, projects)
+
 
 def plot_trends(data, trends, parent_frame):
     """
     Visualizes trends in the data as additional line plots.
+    Repeated calls with the same parent frame reuse the figure; when only the
+    trend texts change they are blitted instead of redrawing the whole chart.
     :param data: The project dataset.
     :param trends: Detected trends for specific columns.
     :param parent_frame: The parent frame in which to embed the trend charts.
     """
-    # Create a figure for the trend charts
-    fig, ax = plt.subplots(figsize=(6, 4))
-    
+    pooled, created = _figure_pool.acquire("trends", parent_frame)
+    if created:
+        # Set the chart title and labels
+        pooled.ax.set_title("Trend Visualization")
+        pooled.ax.set_xlabel("Project")
+        pooled.ax.set_ylabel("Values")
+        pooled.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+
+    projects = data["Project"].tolist()
+    data_changed = _labels_changed(pooled, projects)
+
     # Plot trends for each column
     for idx, column in enumerate(['CSAT', 'OnTimeDelivery', 'BudgetVariance']):
-        ax.plot(data["Project"], data[column], marker="o", label=f"{column} Trend")
+        if _update_line(pooled, f"{column} line", projects, data[column], marker="o", label=f"{column} Trend"):
+            data_changed = True
+
         # Add trend annotations (if trends list is populated)
-        if idx < len(trends):
-            ax.text(
-                len(data["Project"]) - 1, 
-                data[column].iloc[-1], 
-                trends[idx], 
-                fontsize=9, 
-                verticalalignment="center", 
-                horizontalalignment="right"
+        annotation = pooled.artists.get(f"{column} annotation")
+        if annotation is None:
+            annotation = pooled.add_animated(
+                f"{column} annotation",
+                pooled.ax.text(0, 0, "", fontsize=9, verticalalignment="center", horizontalalignment="right"),
             )
+        annotation.set_position((len(projects) - 1, data[column].iloc[-1]))
+        annotation.set_text(trends[idx] if idx < len(trends) else "")
+
+    if data_changed:
+        if created:
+            pooled.ax.legend()
+        _rescale(pooled, projects)
+    else:
+        pooled.blit()
 
-    # Set the chart title and labels
-    ax.set_title("Trend Visualization")
-    ax.set_xlabel("Project")
-    ax.set_ylabel("Values")
-    ax.legend()
 
-    # Embed the figure in the parent frame
-    canvas = FigureCanvasTkAgg(fig, parent_frame)
-    canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
 
+def _fill_kpi_text(kpi_text, kpis):
+    """
+    Write the average and percentile KPI values into the read-only KPI text box.
+    """
+    kpi_text.config(state=tk.NORMAL)
+    kpi_text.delete("1.0", tk.END)
+
+    # Add averages to the insights section
+    kpi_text.insert(tk.END, "Average KPI Values:\n")
+    kpi_text.insert(tk.END, f"- Average CSAT: {kpis['Average CSAT']:.2f}%\n")
+    kpi_text.insert(tk.END, f"- On-Time Delivery Rate: {kpis['On-Time Delivery Rate']:.2f}%\n")
+    kpi_text.insert(tk.END, f"- Average Budget Variance: {kpis['Average Budget Variance']:.2f}\n\n")
 
+    # Add percentile KPIs to the insights section
+    kpi_text.insert(tk.END, "Percentile KPI Values:\n")
+    for column in KPI_COLUMNS:
+        percentiles = ", ".join(f"{label}: {kpis[f'{label} {column}']:.2f}" for label in PERCENTILES)
+        kpi_text.insert(tk.END, f"- {column}: {percentiles}\n")
 
-def plot_kpi_charts(data, insights, kpis, trends):
+    kpi_text.config(state=tk.DISABLED)  # Make the text widget read-only
+
+
+def plot_kpi_charts(data, insights, kpis, trends, reload_data=None):
     """
     Generates Matplotlib charts for KPIs and embeds them in a horizontally scrollable Tkinter window.
     Displays averages and insights in a resizable panel.
+    :param insights: A list of insight records (see Insights.generate_insight_records).
+    :param reload_data: Optional callable returning a fresh validated DataFrame; adds a
+        "Reload Data" button that refreshes the dashboard in place.
     """
     root = tk.Tk()
     root.title("KPI Dashboard")
@@ -80,39 +295,9 @@ def plot_kpi_charts(data, insights, kpis, trends):
 
     chart_frame.bind("<Configure>", configure_canvas)
 
-    # Customer Satisfaction Line Chart
-    fig1, ax1 = plt.subplots(figsize=(6, 4))
-    ax1.plot(data["Project"], data["CSAT"], marker="o")
-    ax1.set_title("Customer Satisfaction Over Projects")
-    ax1.set_xlabel("Project")
-    ax1.set_ylabel("CSAT (%)")
-
-    canvas1 = FigureCanvasTkAgg(fig1, chart_frame)
-    canvas1.get_tk_widget().grid(row=0, column=0, padx=10, pady=10)
-    plt.close(fig1)  # Close the figure to free memory
-
-    # On-Time Delivery Bar Chart
-    fig2, ax2 = plt.subplots(figsize=(6, 4))
-    ax2.bar(data["Project"], data["OnTimeDelivery"])
-    ax2.set_title("On-Time Delivery Rate by Project")
-    ax2.set_xlabel("Project")
-    ax2.set_ylabel("On-Time Delivery Rate (%)")
-
-    canvas2 = FigureCanvasTkAgg(fig2, chart_frame)
-    canvas2.get_tk_widget().grid(row=0, column=1, padx=10, pady=10)
-    plt.close(fig2)  # Close the figure to free memory
-
-    # Budget Variance Bar Chart
-    fig3, ax3 = plt.subplots(figsize=(6, 4))
-    ax3.bar(data["Project"], data["BudgetVariance"], color=["green" if v >= 0 else "red" for v in data["BudgetVariance"]])
-    ax3.axhline(0, color="black", linewidth=0.8, linestyle="--")
-    ax3.set_title("Budget Variance by Project")
-    ax3.set_xlabel("Project")
-    ax3.set_ylabel("Budget Variance")
-
-    canvas3 = FigureCanvasTkAgg(fig3, chart_frame)
-    canvas3.get_tk_widget().grid(row=0, column=2, padx=10, pady=10)
-    plt.close(fig3)  # Close the figure to free memory
+    # The trend chart is packed, so it gets its own cell in the chart grid
+    trends_frame = tk.Frame(chart_frame)
+    trends_frame.grid(row=0, column=3, padx=10, pady=10)
 
     # Create a frame for insights and averages
     insights_frame = tk.Frame(paned_window)
@@ -121,25 +306,50 @@ def plot_kpi_charts(data, insights, kpis, trends):
     insights_label = tk.Label(insights_frame, text="Averages and Insights", font=("Arial", 16, "bold"))
     insights_label.pack(anchor="w", padx=10, pady=5)
 
-    insights_text = tk.Text(insights_frame, wrap=tk.WORD, height=10, font=("Arial", 12))
-    insights_text.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+    kpi_text = tk.Text(insights_frame, wrap=tk.WORD, height=8, font=("Arial", 12))
+    kpi_text.pack(fill=tk.X, padx=10, pady=5)
+
+    # Add insights as a paginated, searchable table
+    insights_view = InsightsView(insights_frame, insights)
+    insights_view.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+
+    def refresh_dashboard(data, insights, kpis, trends):
+        """
+        Redraw the dashboard with new data, reusing the window, frames and pooled figures.
+        """
+        refresh_kpi_charts(data, chart_frame)
+        plot_trends(data, trends, trends_frame)
+        _fill_kpi_text(kpi_text, kpis)
+        insights_view.set_records(insights)
+
+    def reload_dashboard():
+        """
+        Reload and re-analyze the data, keeping the checklist results of this session.
+        """
+        new_data = reload_data()
+        if new_data is None:
+            messagebox.showerror("Reload Error", "The data could not be reloaded.")
+            return
+
+        analysis = analyze_data(new_data)
+        if analysis is None:
+            messagebox.showerror("Reload Error", "The reloaded data could not be analyzed.")
+            return
 
-    # Add averages to the insights section
-    insights_text.insert(tk.END, "Average KPI Values:\n")
-    insights_text.insert(tk.END, f"- Average CSAT: {kpis['Average CSAT']:.2f}%\n")
-    insights_text.insert(tk.END, f"- On-Time Delivery Rate: {kpis['On-Time Delivery Rate']:.2f}%\n")
-    insights_text.insert(tk.END, f"- Average Budget Variance: {kpis['Average Budget Variance']:.2f}\n\n")
+        new_kpis, new_trends, new_insights = analysis
+        new_insights.extend(record for record in insights if record['category'] == 'ISO/CMMI')
+        refresh_dashboard(new_data, new_insights, new_kpis, new_trends)
 
-    # Add insights
-    insights_text.insert(tk.END, "Insights:\n")
-    for insight in insights:
-        insights_text.insert(tk.END, f"- {insight}\n")
+    if reload_data is not None:
+        reload_button = tk.Button(insights_frame, text="Reload Data", font=("Arial", 12, "bold"), command=reload_dashboard)
+        reload_button.pack(anchor="e", padx=10, pady=5)
 
-    insights_text.config(state=tk.DISABLED)  # Make the text widget read-only
+    refresh_dashboard(data, insights, kpis, trends)
 
     # Properly terminate mainloop on window close
     def on_closing():
         print("Exiting GUI...")
+        _figure_pool.clear()
         root.destroy()
         root.quit()
 
@@ -147,9 +357,10 @@ def plot_kpi_charts(data, insights, kpis, trends):
     root.mainloop()
 
 
-def collect_user_data():
+def collect_user_data(checklist_options):
     """
     Provides a GUI interface for users to input data manually.
+    :param checklist_options: ISO/CMMI checklist settings (see select_checklist_source).
     :return: A pandas DataFrame containing the user-provided data.
     """
     input_window = tk.Tk()
@@ -215,7 +426,7 @@ def collect_user_data():
             input_window.destroy()
 
             # Process the data
-            process_and_plot(user_data)
+            process_and_plot(user_data, checklist_options)
         except Exception as e:
             messagebox.showerror("Input Error", f"An error occurred: {e}")
 
@@ -250,10 +461,95 @@ def collect_user_data():
     input_window.mainloop()
 
 
-def process_and_plot(user_data):
+def analyze_data(validated_data):
+    """
+    Calculate KPIs, detect trends and generate insight records for validated data.
+    :param validated_data: A validated pandas DataFrame.
+    :return: A tuple (kpis, trends, insights), or None if the KPI calculation failed.
+    """
+    # Process data to calculate KPIs
+    data_processing = DataProcessing()
+    kpis = data_processing.calculate_kpis(validated_data)
+
+    if kpis is None:
+        print("Error: KPI calculation failed.")
+        return None
+
+    # Detect trends
+    trends = []
+    for column in ['CSAT', 'OnTimeDelivery', 'BudgetVariance']:
+        trend = data_processing.detect_trends(validated_data, column)
+        if trend:
+            trends.append(trend)
+
+    # Debug: Print trends to ensure they are being calculated
+    print("Trends detected:", trends)
+
+    # Generate insights
+    insights_generator = Insights()
+    insights = insights_generator.generate_insight_records(kpis, validated_data)
+
+    # Add detected trends to insights
+    for trend in trends:
+        insights.append({'category': 'Trend', 'project': '', 'message': trend})
+
+    return kpis, trends, insights
+
+
+class _ThreadOutput:
+    """
+    Stand-in for sys.stdout that holds back the output of registered threads,
+    while every other thread keeps writing to the real stream.
+    """
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.buffers = {}
+
+    def hold(self, buffer):
+        self.buffers[threading.get_ident()] = buffer
+
+    def write(self, text):
+        return self.buffers.get(threading.get_ident(), self.stream).write(text)
+
+    def flush(self):
+        self.stream.flush()
+
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
+
+
+def analyze_with_checklist(validated_data, checklist_options):
+    """
+    Run analyze_data on a worker thread while the ISO/CMMI checklist answers are
+    collected. Console prompts and the GUI form stay on the main thread; the
+    analysis output is printed once the answers are in, so it cannot interleave with them.
+    :param validated_data: A validated pandas DataFrame.
+    :param checklist_options: The dictionary returned by select_checklist_source.
+    :return: A tuple (analysis, checklist_summary); analysis is None if the KPI calculation failed.
+    """
+    analysis_output = io.StringIO()
+    output = _ThreadOutput(sys.stdout)
+
+    def run_analysis():
+        output.hold(analysis_output)
+        return analyze_data(validated_data)
+
+    try:
+        with contextlib.redirect_stdout(output), ThreadPoolExecutor(max_workers=1) as executor:
+            analysis = executor.submit(run_analysis)
+            checklist_collector = start_checklist_assessment(checklist_options)
+            checklist_summary = checklist_collector.result() or {}
+            return analysis.result(), checklist_summary
+    finally:
+        print(analysis_output.getvalue(), end="")
+
+
+def process_and_plot(user_data, checklist_options):
     """
     Process the user-provided data and pass it to the existing functions for analysis and visualization.
     :param user_data: A pandas DataFrame containing the user-provided data.
+    :param checklist_options: ISO/CMMI checklist settings (see select_checklist_source).
     """
     try:
         # Validate data
@@ -265,55 +561,114 @@ def process_and_plot(user_data):
             print("Error: Data validation failed.")
             return
 
-        # Process data to calculate KPIs
-        data_processing = DataProcessing()
-        kpis = data_processing.calculate_kpis(validated_data)
-
-        if kpis is None:
-            print("Error: KPI calculation failed.")
+        # Calculate KPIs, trends and insights while the ISO/CMMI checklist answers are collected
+        analysis, checklist_summary = analyze_with_checklist(validated_data, checklist_options)
+        if analysis is None:
             return
+        kpis, trends, insights = analysis
 
-        # Detect trends
-        trends = []
-        for column in ['CSAT', 'OnTimeDelivery', 'BudgetVariance']:
-            trend = data_processing.detect_trends(validated_data, column)
-            if trend:
-                trends.append(trend)
-
-        # Debug: Print trends to ensure they are being calculated
-        print("Trends detected:", trends)
+        # Include checklist summary in insights
+        for key, value in checklist_summary.items():
+            insights.append({'category': 'ISO/CMMI', 'project': '', 'message': f"{key}: {value}"})
 
-        # Generate insights
-        insights_generator = Insights()
-        insights = insights_generator.generate_insights(kpis, validated_data)
+        # Plot KPI charts in a GUI and display insights
+        plot_kpi_charts(validated_data, insights, kpis, trends)
 
-        # Add detected trends to insights
-        insights.append("Detected Trends:")
-        for trend in trends:
-            insights.append(f"- {trend}")
+    except Exception as e:
+        print(f"An unexpected error occurred: {e}")
 
-        # ISO/CMMI Checklist Evaluation
-        checklist = ChecklistAnalysis()
 
-        print("\nCollecting responses for ISO 9001 Checklist:")
-        iso_responses = checklist.collect_responses(checklist.iso_9001_checklist)
 
-        print("\nCollecting responses for CMMI Checklist:")
-        cmmi_responses = checklist.collect_responses(checklist.cmmi_checklist)
+def select_checklist_source(default_project):
+    """
+    Ask where the ISO/CMMI checklist answers should come from, which cached
+    assessment they belong to and which cached answers should be asked again.
+    :param default_project: Assessment name used when none is entered, e.g. the data file's name.
+    :return: A dictionary with 'source', 'file_path', 'project' and 'reassess' keys.
+    """
+    print("\nSelect ISO/CMMI Checklist Source:")
+    print("1. Console (y/n prompts)")
+    print("2. Answers File (JSON or CSV)")
+    print("3. GUI Form")
+    print(f"4. Local HTTP Endpoint (port {CHECKLIST_HTTP_PORT})")
+
+    sources = {"1": "console", "2": "file", "3": "gui", "4": "http"}
+    source = sources.get(input("Enter your choice (1-4, default 1): ").strip(), "console")
+
+    file_path = None
+    if source == "file":
+        file_path = input("Path to the answers file: ").strip()
+
+    project = input(f"Assessment name (default '{default_project}'): ").strip() or default_project
+
+    print("\nRe-assess cached checklist answers?")
+    print("1. No, only ask new or reworded items")
+    print("2. Yes, ask all items again")
+    print("3. Choose the items to ask again")
+    reassess_choice = input("Enter your choice (1-3, default 1): ").strip()
+
+    checklist = ChecklistAnalysis()
+    items = checklist.iso_9001_checklist + checklist.cmmi_checklist
+    reassess = []
+    if reassess_choice == "2":
+        reassess = items
+    elif reassess_choice == "3":
+        for number, item in enumerate(items, start=1):
+            print(f"{number}. {item}")
+        numbers = input("Item numbers to ask again (comma-separated): ").split(",")
+        reassess = [items[int(n) - 1] for n in numbers if n.strip().isdigit() and 0 < int(n) <= len(items)]
+
+    return {"source": source, "file_path": file_path, "project": project, "reassess": reassess}
+
+
+def start_checklist_assessment(checklist_options):
+    """
+    Start collecting ISO/CMMI checklist answers.
+    Answers are cached per assessment, so only new, reworded or re-assessed items are asked again.
+    :param checklist_options: The dictionary returned by select_checklist_source.
+    :return: A started ChecklistCollector; call result() for the summary.
+    """
+    project = checklist_options["project"]
+    print(f"Using checklist assessment '{project}'.")
+
+    collector = ChecklistCollector(
+        ChecklistAnalysis(),
+        project,
+        ChecklistCache(CHECKLIST_CACHE_FILE),
+        source=checklist_options["source"],
+        file_path=checklist_options["file_path"],
+        port=CHECKLIST_HTTP_PORT,
+    )
+    collector.invalidate(checklist_options["reassess"])
+    collector.start()
+    return collector
 
-        checklist_summary = checklist.generate_summary(iso_responses, cmmi_responses)
 
-        # Include checklist summary in insights
-        insights.append("ISO/CMMI Checklist Evaluation Summary:")
-        for key, value in checklist_summary.items():
-            insights.append(f"- {key}: {value}")
+def summarize_large_dataset():
+    """
+    Stream one or more large CSV files through the chunked KPI path and print
+    the KPIs and percentile insights, without loading the data into memory.
+    """
+    default_pattern = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "generated", "*.csv")
+    pattern = input(f"CSV file or glob pattern (default {default_pattern}): ").strip() or default_pattern
+    file_paths = sorted(glob.glob(pattern))
+    if not file_paths:
+        print(f"Error: No files match '{pattern}'.")
+        return
 
-        # Plot KPI charts in a GUI and display insights
-        plot_kpi_charts(validated_data, insights, kpis, trends)
+    required_columns = ['Project', 'CSAT', 'OnTimeDelivery', 'BudgetVariance']
+    kpis = DataProcessing().calculate_kpis_from_files(file_paths, required_columns)
+    if kpis is None:
+        print("Error: KPI calculation failed.")
+        return
 
-    except Exception as e:
-        print(f"An unexpected error occurred: {e}")
+    print("\nKPI Values:")
+    for name, value in kpis.items():
+        print(f"- {name}: {value:.2f}")
 
+    print("\nInsights:")
+    for insight in Insights().generate_percentile_insights(kpis):
+        print(f"- {insight}")
 
 
 def main():
@@ -324,13 +679,15 @@ def main():
     print("Select Mode:")
     print("1. Load Data from File")
     print("2. Enter Data Manually")
+    print("3. Summarize Large Dataset (chunked, e.g. generated shards)")
 
-    choice = input("Enter your choice (1 or 2): ").strip()
+    choice = input("Enter your choice (1, 2 or 3): ").strip()
 
     if choice == "1":
         # File path for the mock data
         DATA_FILE = os.path.join(os.path.dirname(__file__), "data", "mock_data.csv")
         print("Current working directory:", os.getcwd())
+        checklist_options = select_checklist_source(os.path.basename(DATA_FILE))
         try:
             # Load data
             required_columns = ['Project', 'CSAT', 'OnTimeDelivery', 'BudgetVariance']
@@ -347,52 +704,33 @@ def main():
                 print("Error: Data validation failed.")
                 return
 
-            # Process data to calculate KPIs
-            data_processing = DataProcessing()
-            kpis = data_processing.calculate_kpis(validated_data)
-
-            if kpis is None:
-                print("Error: KPI calculation failed.")
+            # Calculate KPIs, trends and insights while the ISO/CMMI checklist answers are collected
+            analysis, checklist_summary = analyze_with_checklist(validated_data, checklist_options)
+            if analysis is None:
                 return
-
-            # Detect trends
-            trends = []
-            for column in ['CSAT', 'OnTimeDelivery', 'BudgetVariance']:
-                trend = data_processing.detect_trends(validated_data, column)
-                if trend:
-                    trends.append(trend)
-
-            # Generate insights
-            insights_generator = Insights()
-            insights = insights_generator.generate_insights(kpis, validated_data)
-            # Add detected trends to insights
-            insights.append("Detected Trends:")
-            for trend in trends:
-                insights.append(f"- {trend}")
-            # ISO/CMMI Checklist Evaluation
-            checklist = ChecklistAnalysis()
-
-            print("\nCollecting responses for ISO 9001 Checklist:")
-            iso_responses = checklist.collect_responses(checklist.iso_9001_checklist)
-
-            print("\nCollecting responses for CMMI Checklist:")
-            cmmi_responses = checklist.collect_responses(checklist.cmmi_checklist)
-
-            checklist_summary = checklist.generate_summary(iso_responses, cmmi_responses)
+            kpis, trends, insights = analysis
 
             # Include checklist summary in insights
-            insights.append("ISO/CMMI Checklist Evaluation Summary:")
             for key, value in checklist_summary.items():
-                insights.append(f"- {key}: {value}")
+                insights.append({'category': 'ISO/CMMI', 'project': '', 'message': f"{key}: {value}"})
+
+            def reload_data():
+                """Load and validate the data file again for the dashboard's reload action."""
+                reloaded = data_ingestion.load_data(DATA_FILE)
+                return None if reloaded is None else data_ingestion.validate_data(reloaded)
 
             # Plot KPI charts in a GUI and display insights
-            plot_kpi_charts(validated_data, insights, kpis, trends)
+            plot_kpi_charts(validated_data, insights, kpis, trends, reload_data=reload_data)
 
         except Exception as e:
             print(f"An unexpected error occurred: {e}")
 
     elif choice == "2":
-        collect_user_data()
+        checklist_options = select_checklist_source("manual")
+        collect_user_data(checklist_options)
+
+    elif choice == "3":
+        summarize_large_dataset()
 
     else:
         print("Invalid choice. Please restart the program.")
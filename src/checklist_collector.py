@@ -0,0 +1,344 @@
+import csv
+import json
+import os
+import threading
+import tkinter as tk
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+CHECKLIST_SOURCES = ("console", "file", "gui", "http")
+
+
+def _parse_answer(value):
+    """
+    Interpret a checklist answer from a file or HTTP payload as a boolean.
+    """
+    if isinstance(value, str):
+        return value.strip().lower() in ("y", "yes", "true", "1")
+    return bool(value)
+
+
+class ChecklistCache:
+    def __init__(self, file_path):
+        """
+        Initialize the ChecklistCache class, a JSON file of per-project checklist answers.
+        Answers are keyed by the item text, so reworded or new items count as unanswered.
+        :param file_path: Path to the JSON cache file (created on first save).
+        """
+        self.file_path = file_path
+        self.projects = {}
+        self._lock = threading.Lock()
+
+        try:
+            with open(file_path) as cache_file:
+                self.projects = json.load(cache_file)
+        except FileNotFoundError:
+            pass
+        except (ValueError, OSError) as e:
+            print(f"Warning: Could not read checklist cache '{file_path}': {e}")
+
+    def _entry(self, project, checklist_name):
+        # Callers must hold self._lock
+        entry = self.projects.setdefault(project, {}).setdefault(checklist_name, {})
+        entry.setdefault('answers', {})
+        entry.setdefault('result', None)
+        return entry
+
+    def answers(self, project, checklist_name):
+        """
+        Return a copy of the cached answers of one checklist, keyed by item text.
+        """
+        with self._lock:
+            return dict(self._entry(project, checklist_name)['answers'])
+
+    def update_answers(self, project, checklist_name, answers):
+        """
+        Store new answers and drop the cached score if any of them changed.
+        :return: True if any answer changed.
+        """
+        with self._lock:
+            entry = self._entry(project, checklist_name)
+            changed = any(entry['answers'].get(item) != value for item, value in answers.items())
+            entry['answers'].update(answers)
+            if changed:
+                entry['result'] = None
+            return changed
+
+    def remove_answers(self, project, checklist_name, items):
+        """
+        Forget the answers of the given items (and the score they fed), so they are asked again.
+        """
+        with self._lock:
+            entry = self._entry(project, checklist_name)
+            for item in items:
+                if entry['answers'].pop(item, None) is not None:
+                    entry['result'] = None
+
+    def result(self, project, checklist_name, checklist):
+        """
+        Return the cached score string, or None if it is missing or was computed
+        for a different version of the checklist.
+        """
+        with self._lock:
+            entry = self._entry(project, checklist_name)
+            return entry['result'] if entry.get('items') == list(checklist) else None
+
+    def set_result(self, project, checklist_name, checklist, result):
+        """
+        Cache the score string together with the checklist items it was computed for.
+        """
+        with self._lock:
+            entry = self._entry(project, checklist_name)
+            entry['result'] = result
+            entry['items'] = list(checklist)
+
+    def save(self):
+        """
+        Write the cache atomically, so an interrupted run never leaves a broken file.
+        """
+        with self._lock:
+            temp_path = f"{self.file_path}.tmp"
+            with open(temp_path, "w") as cache_file:
+                json.dump(self.projects, cache_file, indent=2)
+            os.replace(temp_path, self.file_path)
+
+
+class ChecklistCollector:
+    def __init__(self, analysis, project, cache, source="console", file_path=None, port=8765):
+        """
+        Collect ISO 9001 / CMMI checklist answers while KPIs are computed.
+        Only items without a cached answer are asked for.
+        :param analysis: A ChecklistAnalysis instance providing the checklists and scoring.
+        :param project: Key under which answers are cached.
+        :param cache: A ChecklistCache instance.
+        :param source: One of "console", "file", "gui" or "http".
+        :param file_path: JSON or CSV file with answers (source "file").
+        :param port: Local port of the HTTP endpoint (source "http").
+        """
+        if source not in CHECKLIST_SOURCES:
+            raise ValueError(f"Unknown checklist source '{source}', expected one of {CHECKLIST_SOURCES}.")
+
+        self.analysis = analysis
+        self.project = project
+        self.cache = cache
+        self.source = source
+        self.file_path = file_path
+        self.port = port
+        self.checklists = {
+            "ISO 9001": analysis.iso_9001_checklist,
+            "CMMI": analysis.cmmi_checklist,
+        }
+        self._new_answers = {}
+        self._done = threading.Event()
+        self._thread = None
+
+    def invalidate(self, items):
+        """
+        Drop cached answers for items whose status has changed, so they are asked again.
+        :param items: An iterable of checklist item texts.
+        """
+        items = list(items)
+        for name in self.checklists:
+            self.cache.remove_answers(self.project, name, items)
+
+    def pending_items(self):
+        """
+        Return the items that still need an answer, per checklist.
+        """
+        pending = {}
+        for name, checklist in self.checklists.items():
+            answers = self.cache.answers(self.project, name)
+            missing = [item for item in checklist if item not in answers]
+            if missing:
+                pending[name] = missing
+        return pending
+
+    def start(self):
+        """
+        Start collecting answers. File and HTTP answers are collected in the
+        background without blocking the caller. Console prompts run in the
+        foreground and the GUI form is shown by result(), because input() and
+        Tk belong on the main thread; callers overlap them with the KPI
+        computation by running it on a worker thread.
+        """
+        pending = self.pending_items()
+        # Files are always read, since they may also change answers that are already cached
+        if not pending and self.source != "file":
+            print(f"All checklist answers for '{self.project}' are cached.")
+            self._done.set()
+            return
+
+        if self.source == "gui":
+            return
+        if self.source == "console":
+            self._collect(pending)
+            return
+
+        self._thread = threading.Thread(target=self._collect, args=(pending,), daemon=True)
+        self._thread.start()
+
+    def _collect(self, pending):
+        try:
+            if self.source == "console":
+                self._new_answers = self._collect_from_console(pending)
+            elif self.source == "file":
+                self._new_answers = self._collect_from_file()
+            elif self.source == "http":
+                self._new_answers = self._collect_from_http(pending)
+            else:
+                self._new_answers = self._collect_from_gui(pending)
+        except Exception as e:
+            print(f"An unexpected error occurred while collecting checklist answers: {e}")
+        finally:
+            self._done.set()
+
+    def _collect_from_console(self, pending):
+        answers = {}
+        for name, items in pending.items():
+            print(f"\nCollecting responses for {name} Checklist:")
+            answers[name] = dict(zip(items, self.analysis.collect_responses(items)))
+        return answers
+
+    def _collect_from_file(self):
+        """
+        Read answers from a JSON file ({"ISO 9001": {item: answer}, "CMMI": {...}})
+        or a CSV file with Checklist, Item and Response columns.
+        """
+        answers = {}
+        if self.file_path.lower().endswith(".csv"):
+            with open(self.file_path, newline="") as answers_file:
+                for row in csv.DictReader(answers_file):
+                    answers.setdefault(row['Checklist'], {})[row['Item']] = _parse_answer(row['Response'])
+        else:
+            with open(self.file_path) as answers_file:
+                payload = json.load(answers_file)
+            for name, items in payload.items():
+                answers[name] = {item: _parse_answer(value) for item, value in items.items()}
+
+        print(f"Checklist answers loaded from {self.file_path}.")
+        return answers
+
+    def _collect_from_http(self, pending):
+        """
+        Serve the pending items on a local endpoint until all of them are answered.
+        GET / returns the pending items, POST / accepts {"ISO 9001": {item: answer}, ...}.
+        """
+        answers = {}
+        remaining = {(name, item) for name, items in pending.items() for item in items}
+        lock = threading.Lock()
+
+        class Handler(BaseHTTPRequestHandler):
+            def _reply(self, status, body):
+                payload = json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def do_GET(self):
+                with lock:
+                    body = {}
+                    for name, item in sorted(remaining):
+                        body.setdefault(name, []).append(item)
+                self._reply(200, body)
+
+            def do_POST(self):
+                try:
+                    length = int(self.headers.get("Content-Length", 0))
+                    payload = json.loads(self.rfile.read(length))
+                    with lock:
+                        for name, items in payload.items():
+                            for item, value in items.items():
+                                answers.setdefault(name, {})[item] = _parse_answer(value)
+                                remaining.discard((name, item))
+                        left = len(remaining)
+                except (ValueError, AttributeError) as e:
+                    self._reply(400, {"error": str(e)})
+                    return
+
+                self._reply(200, {"remaining": left})
+                if left == 0:
+                    # shutdown() waits for serve_forever(), so it must not run on this thread
+                    threading.Thread(target=self.server.shutdown, daemon=True).start()
+
+            def log_message(self, format, *args):
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", self.port), Handler)
+        print(f"Waiting for checklist answers at http://127.0.0.1:{self.port}/")
+        try:
+            server.serve_forever()
+        finally:
+            server.server_close()
+        return answers
+
+    def _collect_from_gui(self, pending):
+        """
+        Show a form with one checkbox per pending item.
+        """
+        window = tk.Tk()
+        window.title("KPI Dashboard - ISO/CMMI Checklist")
+
+        variables = {}
+        row = 0
+        for name, items in pending.items():
+            tk.Label(window, text=f"{name} Checklist", font=("Arial", 14, "bold")).grid(row=row, column=0, sticky="w", padx=10, pady=5)
+            row += 1
+            for item in items:
+                variables[(name, item)] = tk.BooleanVar(value=False)
+                tk.Checkbutton(window, text=item, variable=variables[(name, item)], font=("Arial", 11)).grid(row=row, column=0, sticky="w", padx=20)
+                row += 1
+
+        tk.Button(window, text="Submit Answers", font=("Arial", 12, "bold"), command=window.quit).grid(row=row, column=0, pady=10)
+        window.protocol("WM_DELETE_WINDOW", window.quit)
+        window.mainloop()
+
+        answers = {}
+        for (name, item), variable in variables.items():
+            answers.setdefault(name, {})[item] = variable.get()
+        window.destroy()
+        return answers
+
+    def result(self, timeout=None):
+        """
+        Wait for the answers, update the cache and return the checklist summary.
+        Compliance scores are only recomputed for checklists whose answers changed.
+        :param timeout: Seconds to wait for background collection (None waits forever).
+        :return: A dictionary like ChecklistAnalysis.generate_summary, or None on timeout.
+        """
+        if self.source == "gui" and not self._done.is_set():
+            self._collect(self.pending_items())
+
+        if not self._done.wait(timeout):
+            print("Error: Timed out waiting for checklist answers.")
+            return None
+
+        evaluators = {
+            "ISO 9001": ("ISO 9001 Compliance", self.analysis.evaluate_iso_checklist),
+            "CMMI": ("CMMI Maturity Level", self.analysis.evaluate_cmmi_checklist),
+        }
+
+        summary = {}
+        for name, checklist in self.checklists.items():
+            self.cache.update_answers(self.project, name, self._new_answers.get(name, {}))
+            answers = self.cache.answers(self.project, name)
+
+            missing = [item for item in checklist if item not in answers]
+            if missing:
+                print(f"Warning: {len(missing)} {name} item(s) unanswered, counted as 'n'.")
+
+            # Only checklists whose answers (or items) changed are scored again
+            key, evaluate = evaluators[name]
+            result = self.cache.result(self.project, name, checklist)
+            if result is None or missing:
+                compliance, level = evaluate([answers.get(item, False) for item in checklist])
+                result = f"{compliance:.2f}% ({level})"
+                self.cache.set_result(self.project, name, checklist, result)
+            summary[key] = result
+
+        try:
+            self.cache.save()
+        except OSError as e:
+            print(f"Warning: Could not save checklist cache: {e}")
+
+        return summary
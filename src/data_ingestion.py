@@ -35,6 +35,38 @@ class DataIngestion:
 
         return None
 
+    def load_data_in_chunks(self, file_path, chunksize=100000):
+        """
+        Lazily load and validate a large CSV file chunk by chunk.
+        Unlike load_data, errors are raised, so a caller never mistakes a
+        truncated stream for a complete one. Only columns and data types are
+        checked: missing values are left in place (the quantile sketches skip
+        them) and nothing is printed per chunk.
+        :param file_path: Path to the CSV file.
+        :param chunksize: Number of rows per chunk.
+        :return: A generator of validated Pandas DataFrames.
+        """
+        try:
+            for index, chunk in enumerate(pd.read_csv(file_path, chunksize=chunksize)):
+                missing_cols = [col for col in self.required_columns if col not in chunk.columns]
+                if missing_cols:
+                    raise ValueError(f"Missing required columns: {missing_cols}")
+
+                for col in self.required_columns:
+                    if chunk[col].dtype not in ['int64', 'float64', 'object']:
+                        raise ValueError(f"Column '{col}' in chunk {index} of '{file_path}' has invalid data type: {chunk[col].dtype}")
+                yield chunk
+
+        except FileNotFoundError:
+            print(f"Error: The file '{file_path}' was not found.")
+            raise
+        except ValueError as ve:
+            print(f"Validation Error: {ve}")
+            raise
+        except Exception as e:
+            print(f"An unexpected error occurred: {e}")
+            raise
+
     def validate_data(self, data):
         """
         Validate the data for missing values and correct data types.
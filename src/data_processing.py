@@ -1,11 +1,36 @@
+from concurrent.futures import ProcessPoolExecutor
 import pandas as pd
+from src.data_ingestion import DataIngestion
+from src.quantile_sketch import QuantileSketch
+
+KPI_COLUMNS = ['CSAT', 'OnTimeDelivery', 'BudgetVariance']
+
+# Percentile KPIs reported for every KPI column, e.g. 'Median CSAT', 'P90 CSAT'.
+# P1 covers the low tail, where the over-budget (negative variance) outliers are.
+PERCENTILES = {'P1': 0.01, 'Median': 0.5, 'P90': 0.9, 'P99': 0.99}
+
+
+def _sketch_file(file_path, required_columns, chunksize, sketch_k):
+    """
+    Build KPI sketches for one file chunk by chunk; runs in a worker process.
+    """
+    data_ingestion = DataIngestion(required_columns=required_columns)
+    data_processing = DataProcessing(sketch_k=sketch_k)
+    sketches = None
+    for chunk in data_ingestion.load_data_in_chunks(file_path, chunksize=chunksize):
+        sketches = data_processing.update_kpi_sketches(chunk, sketches)
+    if sketches is None:
+        raise ValueError(f"The file '{file_path}' contains no data.")
+    return sketches
+
 
 class DataProcessing:
-    def __init__(self):
+    def __init__(self, sketch_k=200):
         """
         Initialize the DataProcessing class.
+        :param sketch_k: Accuracy parameter for the percentile sketches (see QuantileSketch).
         """
-        pass
+        self.sketch_k = sketch_k
 
     def calculate_kpis(self, data):
         """
@@ -25,6 +50,13 @@ class DataProcessing:
                 'Average Budget Variance': avg_budget_variance,
             }
 
+            # Percentile KPIs are far less sensitive to outliers than the means.
+            # The whole DataFrame is in memory here, so they are computed exactly.
+            for column in KPI_COLUMNS:
+                values = pd.to_numeric(data[column], errors='coerce').quantile(list(PERCENTILES.values()))
+                for label, value in zip(PERCENTILES, values):
+                    kpis[f"{label} {column}"] = value
+
             print("KPI Calculation Successful.")
             return kpis
 
@@ -67,4 +99,88 @@ class DataProcessing:
 
         return None
 
+    def update_kpi_sketches(self, data, sketches=None):
+        """
+        Feed a DataFrame (or one chunk of a larger dataset) into per-column quantile sketches.
+        :param data: A Pandas DataFrame containing the KPI columns.
+        :param sketches: Sketches from earlier chunks to update, or None to start fresh.
+        :return: A dictionary mapping each KPI column to its QuantileSketch.
+        """
+        if sketches is None:
+            sketches = {column: QuantileSketch(k=self.sketch_k) for column in KPI_COLUMNS}
+        for column in KPI_COLUMNS:
+            sketches[column].update_many(pd.to_numeric(data[column], errors='coerce'))
+        return sketches
+
+    def merge_kpi_sketches(self, sketch_sets):
+        """
+        Merge per-column sketches produced by parallel workers or separate chunks.
+        :param sketch_sets: An iterable of dictionaries returned by update_kpi_sketches.
+        :return: A single dictionary of merged sketches.
+        """
+        merged = {column: QuantileSketch(k=self.sketch_k) for column in KPI_COLUMNS}
+        for sketches in sketch_sets:
+            for column in KPI_COLUMNS:
+                merged[column].merge(sketches[column])
+        return merged
+
+    def calculate_percentile_kpis(self, sketches):
+        """
+        Read the PERCENTILES (P1, median, p90 and p99) of each KPI column from its sketch.
+        :param sketches: A dictionary mapping KPI columns to QuantileSketch objects.
+        :return: A dictionary such as {'P1 CSAT': ..., 'Median CSAT': ..., 'P90 CSAT': ..., ...}.
+        """
+        percentile_kpis = {}
+        for column in KPI_COLUMNS:
+            values = sketches[column].quantiles(PERCENTILES.values())
+            for label, value in zip(PERCENTILES, values):
+                percentile_kpis[f"{label} {column}"] = value
+        return percentile_kpis
 
+    def calculate_kpis_from_sketches(self, sketches):
+        """
+        Calculate the full KPI dictionary from sketches alone, for data that was
+        ingested in chunks and never held in memory as a single DataFrame.
+        :param sketches: A dictionary mapping KPI columns to QuantileSketch objects.
+        :return: A dictionary with calculated KPIs, None if the sketches are empty.
+        """
+        if any(len(sketches[column]) == 0 for column in KPI_COLUMNS):
+            print("Error: No data available for KPI calculation.")
+            return None
+
+        kpis = {
+            'Average CSAT': sketches['CSAT'].mean(),
+            'On-Time Delivery Rate': sketches['OnTimeDelivery'].mean(),
+            'Average Budget Variance': sketches['BudgetVariance'].mean(),
+        }
+        kpis.update(self.calculate_percentile_kpis(sketches))
+        return kpis
+
+    def calculate_kpis_from_files(self, file_paths, required_columns, chunksize=100000, workers=None):
+        """
+        Calculate KPIs for datasets too large to load at once, e.g. generated shards.
+        Each file is streamed in chunks into sketches by a worker process, and the
+        per-file sketches are merged.
+        :param file_paths: A list of CSV file paths.
+        :param required_columns: Columns every chunk must contain.
+        :param chunksize: Number of rows read per chunk.
+        :param workers: Number of worker processes (defaults to the CPU count).
+        :return: A dictionary with calculated KPIs, None if any file failed.
+        """
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = [
+                    executor.submit(_sketch_file, file_path, required_columns, chunksize, self.sketch_k)
+                    for file_path in file_paths
+                ]
+                sketches = self.merge_kpi_sketches(future.result() for future in futures)
+
+            kpis = self.calculate_kpis_from_sketches(sketches)
+            if kpis is not None:
+                print(f"KPI Calculation Successful ({len(file_paths)} file(s)).")
+            return kpis
+
+        except Exception as e:
+            print(f"An unexpected error occurred during chunked KPI calculation: {e}")
+
+        return None
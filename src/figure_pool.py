@@ -0,0 +1,105 @@
+import tkinter as tk
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
+
+class PooledFigure:
+    def __init__(self, parent, figsize=(6, 4)):
+        """
+        Wrap a Matplotlib figure, its single axes and its Tk canvas so they can be reused.
+        :param parent: The Tk widget the canvas is embedded in.
+        :param figsize: Size of the figure in inches.
+        """
+        # Figure() instead of plt.subplots() keeps the figure out of pyplot's registry,
+        # so it never has to be closed and is not leaked between refreshes.
+        self.fig = Figure(figsize=figsize)
+        self.ax = self.fig.add_subplot()
+        self.canvas = FigureCanvasTkAgg(self.fig, parent)
+        self.parent = parent
+        self.artists = {}
+        self.animated = []
+        self.background = None
+        self.canvas.mpl_connect("draw_event", self._on_draw)
+
+    def _on_draw(self, event):
+        """
+        Cache the static background after every full draw, then paint the animated artists on top.
+        """
+        self.background = self.canvas.copy_from_bbox(self.fig.bbox)
+        for artist in self.animated:
+            self.fig.draw_artist(artist)
+
+    def add_animated(self, name, artist):
+        """
+        Register an artist that is updated by blitting (annotations, highlights).
+        :param name: Key under which the artist is stored in self.artists.
+        :param artist: A Matplotlib artist.
+        :return: The artist.
+        """
+        artist.set_animated(True)
+        self.artists[name] = artist
+        self.animated.append(artist)
+        return artist
+
+    def is_alive(self):
+        """
+        Check whether the Tk widget backing the canvas still exists.
+        """
+        try:
+            return bool(self.canvas.get_tk_widget().winfo_exists())
+        except tk.TclError:
+            # The whole Tk application has been destroyed
+            return False
+
+    def redraw(self):
+        """
+        Schedule a full redraw; used when the static content (data, axes limits) changed.
+        """
+        self.canvas.draw_idle()
+
+    def blit(self):
+        """
+        Redraw only the animated artists over the cached background.
+        Falls back to a full draw if no background has been captured yet.
+        """
+        if self.background is None:
+            self.canvas.draw()
+            return
+
+        self.canvas.restore_region(self.background)
+        for artist in self.animated:
+            self.fig.draw_artist(artist)
+        self.canvas.blit(self.fig.bbox)
+        self.canvas.flush_events()
+
+
+class FigurePool:
+    def __init__(self):
+        """
+        Initialize an empty pool of figures keyed by chart name.
+        """
+        self.figures = {}
+
+    def acquire(self, key, parent, figsize=(6, 4)):
+        """
+        Return the pooled figure for a chart, creating it on first use or when its
+        Tk parent has changed or been destroyed.
+        :param key: Name of the chart, e.g. "csat".
+        :param parent: The Tk widget the canvas should live in.
+        :param figsize: Size of the figure in inches.
+        :return: A tuple (PooledFigure, created) where created tells whether the
+            axes are new and still have to be decorated.
+        """
+        pooled = self.figures.get(key)
+        if pooled is not None and pooled.parent is parent and pooled.is_alive():
+            return pooled, False
+
+        pooled = PooledFigure(parent, figsize=figsize)
+        self.figures[key] = pooled
+        return pooled, True
+
+    def clear(self):
+        """
+        Drop every pooled figure, e.g. when the dashboard window is destroyed.
+        """
+        self.figures.clear()
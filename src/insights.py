@@ -1,45 +1,110 @@
+# Default percentile rules as (KPI name, "below" or "above", threshold).
+DEFAULT_PERCENTILE_THRESHOLDS = [
+    ('Median CSAT', 'below', 80),
+    ('Median OnTimeDelivery', 'below', 90),
+    # Negative variance means over budget, so the outliers sit in the low tail
+    ('P1 BudgetVariance', 'below', -10),
+]
+
 class Insights:
-    def __init__(self):
+    def __init__(self, percentile_thresholds=None):
         """
         Initialize the Insights class.
+        :param percentile_thresholds: Optional list of (KPI name, "below"/"above", threshold)
+            rules checked against percentile KPIs such as 'P90 CSAT'.
         """
-        pass
+        if percentile_thresholds is None:
+            percentile_thresholds = DEFAULT_PERCENTILE_THRESHOLDS
+        self.percentile_thresholds = percentile_thresholds
 
-    def generate_insights(self, kpis, data):
+    def generate_insight_records(self, kpis, data):
         """
-        Generate actionable insights based on calculated KPIs and project-specific data.
+        Generate insights as structured records, one per finding and one per
+        over/under-budget project, so views can page, search and filter them.
         :param kpis: A dictionary containing KPI values.
         :param data: The original project data.
-        :return: A list of actionable insights.
+        :return: A list of dictionaries with 'category', 'project' and 'message' keys.
         """
         try:
-            insights = []
+            records = []
 
             # Insight for CSAT
             if kpis.get('Average CSAT', 0) < 80:
-                insights.append("Customer satisfaction is below the desired threshold. Focus on improving communication with clients and addressing their concerns effectively.")
+                records.append({'category': 'CSAT', 'project': '', 'message': "Customer satisfaction is below the desired threshold. Focus on improving communication with clients and addressing their concerns effectively."})
             else:
-                insights.append("Customer satisfaction is at an acceptable level. Continue maintaining high-quality delivery.")
+                records.append({'category': 'CSAT', 'project': '', 'message': "Customer satisfaction is at an acceptable level. Continue maintaining high-quality delivery."})
 
             # Insight for On-Time Delivery Rate
             if kpis.get('On-Time Delivery Rate', 0) < 90:
-                insights.append("On-time delivery rate is below 90%. Consider optimizing project schedules and improving time management practices.")
+                records.append({'category': 'On-Time Delivery', 'project': '', 'message': "On-time delivery rate is below 90%. Consider optimizing project schedules and improving time management practices."})
             else:
-                insights.append("On-time delivery rate is excellent. Maintain the current project scheduling strategies.")
+                records.append({'category': 'On-Time Delivery', 'project': '', 'message': "On-time delivery rate is excellent. Maintain the current project scheduling strategies."})
 
             # Insight for Budget Variance (Project-Specific)
-            over_budget_projects = data[data['BudgetVariance'] < 0]['Project'].tolist()
-            under_budget_projects = data[data['BudgetVariance'] > 0]['Project'].tolist()
+            over_budget = data[data['BudgetVariance'] < 0]
+            under_budget = data[data['BudgetVariance'] > 0]
+
+            for project, variance in zip(over_budget['Project'], over_budget['BudgetVariance']):
+                records.append({'category': 'Over Budget', 'project': project, 'message': f"Over budget (variance {variance:.2f}). Review cost management strategies for this project."})
+            for project, variance in zip(under_budget['Project'], under_budget['BudgetVariance']):
+                records.append({'category': 'Under Budget', 'project': project, 'message': f"Within or under budget (variance {variance:.2f}). Consider re-evaluating resource allocation to optimize usage."})
 
-            if over_budget_projects:
-                insights.append(f"The following projects are over budget: {', '.join(over_budget_projects)}. Review cost management strategies for these projects.")
-            if under_budget_projects:
-                insights.append(f"The following projects are staying within or under budget: {', '.join(under_budget_projects)}. Consider re-evaluating resource allocation to optimize usage.")
+            # Insights for percentile thresholds (robust against outliers)
+            for insight in self.generate_percentile_insights(kpis):
+                records.append({'category': 'Percentile', 'project': '', 'message': insight})
 
             print("Insights generation successful.")
-            return insights
+            return records
 
         except Exception as e:
             print(f"An unexpected error occurred during insight generation: {e}")
             return None
 
+    def generate_insights(self, kpis, data):
+        """
+        Generate actionable insights based on calculated KPIs and project-specific data.
+        :param kpis: A dictionary containing KPI values.
+        :param data: The original project data.
+        :return: A list of actionable insights.
+        """
+        records = self.generate_insight_records(kpis, data)
+        if records is None:
+            return None
+
+        insights = []
+        over_budget_projects = []
+        under_budget_projects = []
+        for record in records:
+            if record['category'] == 'Over Budget':
+                over_budget_projects.append(record['project'])
+            elif record['category'] == 'Under Budget':
+                under_budget_projects.append(record['project'])
+            elif record['category'] != 'Percentile':
+                insights.append(record['message'])
+
+        # Project-specific budget insights are collapsed into one line each
+        if over_budget_projects:
+            insights.append(f"The following projects are over budget: {', '.join(over_budget_projects)}. Review cost management strategies for these projects.")
+        if under_budget_projects:
+            insights.append(f"The following projects are staying within or under budget: {', '.join(under_budget_projects)}. Consider re-evaluating resource allocation to optimize usage.")
+
+        insights.extend(record['message'] for record in records if record['category'] == 'Percentile')
+        return insights
+
+    def generate_percentile_insights(self, kpis):
+        """
+        Check percentile KPIs against the configured thresholds.
+        :param kpis: A dictionary containing KPI values, including percentile KPIs.
+        :return: A list of insights for every threshold that was crossed.
+        """
+        insights = []
+        for kpi_name, direction, threshold in self.percentile_thresholds:
+            value = kpis.get(kpi_name)
+            if value is None:
+                continue
+
+            if direction == 'below' and value < threshold:
+                insights.append(f"{kpi_name} is {value:.2f}, below the threshold of {threshold}.")
+            elif direction == 'above' and value > threshold:
+                insights.append(f"{kpi_name} is {value:.2f}, above the threshold of {threshold}.")
+        return insights
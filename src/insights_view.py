@@ -0,0 +1,128 @@
+import tkinter as tk
+from tkinter import ttk
+
+ALL_CATEGORIES = "All"
+
+
+class InsightsView:
+    def __init__(self, parent, records, page_size=200):
+        """
+        Paginated, searchable table of insight records.
+        Only the rows of the current page are inserted into the Treeview, so the
+        widget's memory and render cost do not grow with the number of projects.
+        :param parent: The Tk widget in which to embed the view.
+        :param records: A list of dictionaries with 'category', 'project' and 'message' keys.
+        :param page_size: Number of rows shown per page.
+        """
+        self.page_size = page_size
+        self.records = []
+        self.matches = []
+        self.page = 0
+        self._search_job = None
+
+        self.frame = tk.Frame(parent)
+
+        # Search and filter controls
+        controls = tk.Frame(self.frame)
+        controls.pack(fill=tk.X, pady=(0, 5))
+
+        tk.Label(controls, text="Search:", font=("Arial", 12)).pack(side=tk.LEFT)
+        self.search_var = tk.StringVar()
+        search_entry = tk.Entry(controls, textvariable=self.search_var, font=("Arial", 12))
+        search_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
+        search_entry.bind("<KeyRelease>", lambda e: self._schedule_filter())
+
+        tk.Label(controls, text="Category:", font=("Arial", 12)).pack(side=tk.LEFT)
+        self.category_var = tk.StringVar(value=ALL_CATEGORIES)
+        self.category_box = ttk.Combobox(controls, textvariable=self.category_var, state="readonly", width=18)
+        self.category_box.pack(side=tk.LEFT, padx=5)
+        self.category_box.bind("<<ComboboxSelected>>", lambda e: self.apply_filter())
+
+        # Insight table
+        table = tk.Frame(self.frame)
+        table.pack(fill=tk.BOTH, expand=True)
+
+        self.tree = ttk.Treeview(table, columns=("category", "project", "message"), show="headings")
+        self.tree.heading("category", text="Category")
+        self.tree.heading("project", text="Project")
+        self.tree.heading("message", text="Insight")
+        self.tree.column("category", width=130, stretch=False)
+        self.tree.column("project", width=130, stretch=False)
+        self.tree.column("message", width=700)
+        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+
+        scrollbar = ttk.Scrollbar(table, orient=tk.VERTICAL, command=self.tree.yview)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.tree.configure(yscrollcommand=scrollbar.set)
+
+        # Pagination controls
+        pager = tk.Frame(self.frame)
+        pager.pack(fill=tk.X, pady=(5, 0))
+
+        tk.Button(pager, text="< Prev", command=lambda: self.show_page(self.page - 1)).pack(side=tk.LEFT)
+        tk.Button(pager, text="Next >", command=lambda: self.show_page(self.page + 1)).pack(side=tk.LEFT, padx=5)
+        self.page_label = tk.Label(pager, font=("Arial", 10))
+        self.page_label.pack(side=tk.LEFT, padx=10)
+
+        self.set_records(records)
+
+    def pack(self, **kwargs):
+        self.frame.pack(**kwargs)
+
+    def set_records(self, records):
+        """
+        Replace the displayed records and reset search, filter and page.
+        :param records: A list of insight record dictionaries.
+        """
+        self.records = records
+        categories = sorted({record['category'] for record in records})
+        self.category_box["values"] = [ALL_CATEGORIES] + categories
+        self.category_var.set(ALL_CATEGORIES)
+        self.search_var.set("")
+        self.apply_filter()
+
+    def _schedule_filter(self):
+        """
+        Debounce typing so the records are filtered once the user pauses.
+        """
+        if self._search_job is not None:
+            self.frame.after_cancel(self._search_job)
+        self._search_job = self.frame.after(250, self.apply_filter)
+
+    def apply_filter(self):
+        """
+        Recompute the records matching the search text and category, then show the first page.
+        """
+        self._search_job = None
+        query = self.search_var.get().strip().lower()
+        category = self.category_var.get()
+
+        # Only indices are kept, the records themselves are not copied
+        self.matches = [
+            idx for idx, record in enumerate(self.records)
+            if (category == ALL_CATEGORIES or record['category'] == category)
+            and (not query
+                 or query in str(record['project']).lower()
+                 or query in record['message'].lower())
+        ]
+        self.show_page(0)
+
+    def page_count(self):
+        return max(1, -(-len(self.matches) // self.page_size))
+
+    def show_page(self, page):
+        """
+        Render a single page of matching records into the Treeview.
+        :param page: Zero-based page number; clamped to the valid range.
+        """
+        self.page = min(max(page, 0), self.page_count() - 1)
+        self.tree.delete(*self.tree.get_children())
+
+        start = self.page * self.page_size
+        for idx in self.matches[start:start + self.page_size]:
+            record = self.records[idx]
+            self.tree.insert("", tk.END, values=(record['category'], record['project'], record['message']))
+
+        self.page_label.config(
+            text=f"Page {self.page + 1} of {self.page_count()} ({len(self.matches)} of {len(self.records)} insights)"
+        )
@@ -0,0 +1,182 @@
+import math
+import random
+import numpy as np
+
+
+class QuantileSketch:
+    """
+    Mergeable streaming quantile sketch (KLL-style compactor hierarchy).
+
+    Values are kept in a stack of "compactors". Level h holds items that each
+    stand for 2**h original values. When a level overflows, it is sorted and
+    every other item (from a random offset) is promoted to the next level.
+
+    Memory is bounded by roughly 3 * k items regardless of how many values
+    are added. With the default k=200 the normalized rank error of a quantile
+    query is about 1.65% with 99% confidence (e.g. a reported p90 lies between
+    the true p88.35 and p91.65). The error shrinks roughly as 1/k.
+
+    count, sum, min and max are tracked exactly, so the extremes (q=0, q=1)
+    and the mean are never approximated.
+    """
+
+    def __init__(self, k=200, seed=None):
+        """
+        Initialize an empty sketch.
+        :param k: Accuracy parameter; larger k means more memory and less error.
+        :param seed: Optional seed for the compaction coin flips (reproducibility).
+        """
+        if k < 8:
+            raise ValueError("k must be at least 8.")
+        self.k = k
+        self.levels = [[]]
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+        self._rng = random.Random(seed)
+
+    def __len__(self):
+        return self.count
+
+    def _capacity(self, level):
+        """
+        Capacity of a compactor; lower levels shrink geometrically by 2/3.
+        """
+        depth = len(self.levels) - level - 1
+        return max(2, int(math.ceil(self.k * (2.0 / 3.0) ** depth)))
+
+    def _size(self):
+        return sum(len(level) for level in self.levels)
+
+    def _max_size(self):
+        return sum(self._capacity(h) for h in range(len(self.levels)))
+
+    def _compress(self):
+        """
+        Compact overflowing levels until the sketch fits its memory budget.
+        """
+        while self._size() >= self._max_size():
+            for h, items in enumerate(self.levels):
+                if len(items) >= self._capacity(h):
+                    if h + 1 == len(self.levels):
+                        self.levels.append([])
+                    items.sort()
+                    offset = self._rng.randint(0, 1)
+                    # An odd leftover stays behind so no weight is lost.
+                    keep = [items.pop()] if len(items) % 2 else []
+                    self.levels[h + 1].extend(items[offset::2])
+                    self.levels[h] = keep
+                    break
+
+    def update(self, value):
+        """
+        Add a single value to the sketch. NaN values are ignored.
+        :param value: A numeric value.
+        """
+        value = float(value)
+        if math.isnan(value):
+            return
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+        self.levels[0].append(value)
+        if len(self.levels[0]) >= self._capacity(0):
+            self._compress()
+
+    def update_many(self, values):
+        """
+        Add a batch of values (e.g. a Pandas Series or a chunk column). NaN values are ignored.
+        The exact statistics are updated with numpy; level 0 is then filled in
+        blocks of k items and compacted as it overflows.
+        :param values: An array-like of numeric values.
+        """
+        values = np.asarray(values, dtype=float).ravel()
+        values = values[~np.isnan(values)]
+        if values.size == 0:
+            return self
+
+        self.count += int(values.size)
+        self.total += float(values.sum())
+        batch_min, batch_max = float(values.min()), float(values.max())
+        self.min = batch_min if self.min is None else min(self.min, batch_min)
+        self.max = batch_max if self.max is None else max(self.max, batch_max)
+
+        values = values.tolist()
+        for start in range(0, len(values), self.k):
+            self.levels[0].extend(values[start:start + self.k])
+            if len(self.levels[0]) >= self._capacity(0):
+                self._compress()
+        return self
+
+    def merge(self, other):
+        """
+        Merge another sketch into this one in place. Both sketches should use
+        the same k; the result keeps this sketch's k.
+        :param other: Another QuantileSketch, e.g. from a parallel worker.
+        :return: This sketch.
+        """
+        if other.count == 0:
+            return self
+        while len(self.levels) < len(other.levels):
+            self.levels.append([])
+        for h, items in enumerate(other.levels):
+            self.levels[h].extend(items)
+        self.count += other.count
+        self.total += other.total
+        self.min = other.min if self.min is None else min(self.min, other.min)
+        self.max = other.max if self.max is None else max(self.max, other.max)
+        self._compress()
+        return self
+
+    def mean(self):
+        """
+        Exact mean of all values added so far, or None if the sketch is empty.
+        """
+        return self.total / self.count if self.count else None
+
+    def quantiles(self, qs):
+        """
+        Estimate several quantiles in one pass over the retained items.
+        :param qs: An iterable of quantiles in [0, 1].
+        :return: A list of estimated values (None entries if the sketch is empty).
+        """
+        qs = list(qs)
+        for q in qs:
+            if not 0.0 <= q <= 1.0:
+                raise ValueError(f"Quantile must be within [0, 1], got {q}.")
+        if self.count == 0:
+            return [None for _ in qs]
+
+        weighted = sorted(
+            (value, 1 << h) for h, items in enumerate(self.levels) for value in items
+        )
+        total_weight = sum(weight for _, weight in weighted)
+
+        results = []
+        for q in qs:
+            if q == 0.0:
+                results.append(self.min)
+                continue
+            if q == 1.0:
+                results.append(self.max)
+                continue
+            target = q * total_weight
+            cumulative = 0
+            estimate = weighted[-1][0]
+            for value, weight in weighted:
+                cumulative += weight
+                if cumulative >= target:
+                    estimate = value
+                    break
+            results.append(estimate)
+        return results
+
+    def quantile(self, q):
+        """
+        Estimate a single quantile.
+        :param q: A quantile in [0, 1] (0.5 for the median, 0.9 for p90, ...).
+        :return: The estimated value, or None if the sketch is empty.
+        """
+        return self.quantiles([q])[0]
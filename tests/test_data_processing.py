@@ -0,0 +1,35 @@
+import numpy as np
+import pandas as pd
+import pytest
+from src.data_processing import DataProcessing
+
+REQUIRED_COLUMNS = ['Project', 'CSAT', 'OnTimeDelivery', 'BudgetVariance']
+
+
+def test_chunked_kpis_skip_missing_values(tmp_path):
+    rng = np.random.default_rng(0)
+    data = pd.DataFrame({
+        'Project': [f"Project{i}" for i in range(4000)],
+        'CSAT': rng.normal(85, 6, 4000),
+        'OnTimeDelivery': rng.normal(90, 5, 4000),
+        'BudgetVariance': rng.normal(0, 2.5, 4000),
+    })
+    for column in REQUIRED_COLUMNS[1:]:
+        data.loc[rng.random(4000) < 0.05, column] = np.nan
+
+    file_path = tmp_path / "data.csv"
+    data.to_csv(file_path, index=False)
+
+    kpis = DataProcessing().calculate_kpis_from_files([str(file_path)], REQUIRED_COLUMNS, chunksize=500, workers=1)
+
+    # Missing values must be ignored, not counted as zeros
+    assert kpis['Average CSAT'] == pytest.approx(data['CSAT'].mean())
+    assert kpis['P1 CSAT'] == pytest.approx(data['CSAT'].quantile(0.01), abs=1.0)
+    assert kpis['P1 OnTimeDelivery'] > 50
+
+
+def test_chunked_kpis_fail_on_truncated_file(tmp_path):
+    file_path = tmp_path / "bad.csv"
+    file_path.write_text('Project,CSAT,OnTimeDelivery,BudgetVariance\nP1,1,2,3\n"P2,1')
+
+    assert DataProcessing().calculate_kpis_from_files([str(file_path)], REQUIRED_COLUMNS, workers=1) is None
@@ -0,0 +1,80 @@
+import pickle
+import numpy as np
+import pytest
+from src.quantile_sketch import QuantileSketch
+
+QUANTILES = [0.01, 0.1, 0.5, 0.9, 0.99]
+
+# Documented normalized rank error at k=200 (99% confidence)
+RANK_ERROR = 0.0165
+
+
+def rank_of(sorted_values, value):
+    return np.searchsorted(sorted_values, value, side="right") / len(sorted_values)
+
+
+def test_rank_error_within_documented_bound():
+    values = np.random.default_rng(0).standard_t(3, size=200_000)
+    sketch = QuantileSketch(seed=1).update_many(values)
+    sorted_values = np.sort(values)
+
+    for q, estimate in zip(QUANTILES, sketch.quantiles(QUANTILES)):
+        assert abs(rank_of(sorted_values, estimate) - q) <= RANK_ERROR
+
+
+def test_update_many_matches_update():
+    values = np.random.default_rng(2).normal(size=20_000)
+    batched = QuantileSketch(seed=3).update_many(values)
+    single = QuantileSketch(seed=3)
+    for value in values:
+        single.update(value)
+
+    sorted_values = np.sort(values)
+    assert len(batched) == len(single) == len(values)
+    assert batched.mean() == pytest.approx(single.mean())
+    for q, from_batch, from_single in zip(QUANTILES, batched.quantiles(QUANTILES), single.quantiles(QUANTILES)):
+        assert abs(rank_of(sorted_values, from_batch) - q) <= RANK_ERROR
+        assert abs(rank_of(sorted_values, from_single) - q) <= RANK_ERROR
+
+
+def test_merge_is_equivalent_to_a_single_sketch():
+    values = np.random.default_rng(4).exponential(size=120_000)
+    parts = [QuantileSketch(seed=i).update_many(part) for i, part in enumerate(np.array_split(values, 4))]
+
+    # Sketches travel between worker processes, so merge pickled copies
+    merged = pickle.loads(pickle.dumps(parts[0]))
+    for part in parts[1:]:
+        merged.merge(pickle.loads(pickle.dumps(part)))
+
+    sorted_values = np.sort(values)
+    assert len(merged) == len(values)
+    assert merged.mean() == pytest.approx(values.mean())
+    assert merged.quantile(0.0) == values.min()
+    assert merged.quantile(1.0) == values.max()
+    for q, estimate in zip(QUANTILES, merged.quantiles(QUANTILES)):
+        assert abs(rank_of(sorted_values, estimate) - q) <= RANK_ERROR
+
+
+def test_empty_and_nan_values():
+    sketch = QuantileSketch()
+    assert len(sketch) == 0
+    assert sketch.mean() is None
+    assert sketch.quantiles([0.5, 0.9]) == [None, None]
+
+    sketch.update_many([np.nan, 1.0, np.nan, 3.0])
+    sketch.update(float("nan"))
+    assert len(sketch) == 2
+    assert sketch.mean() == 2.0
+    assert sketch.quantile(0.5) in (1.0, 3.0)
+
+    with pytest.raises(ValueError):
+        sketch.quantile(1.5)
+
+
+def test_size_is_bounded():
+    sketch = QuantileSketch(k=200)
+    for _ in range(10):
+        sketch.update_many(np.random.default_rng(5).random(100_000))
+
+    assert len(sketch) == 1_000_000
+    assert sketch._size() <= 3 * sketch.k